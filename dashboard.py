@@ -1,9 +1,9 @@
 import streamlit as st
 import json
 import os
-import pandas as pd
-import plotly.express as px
-# Note: Orchestrator is imported lazily when needed to avoid loading on every page view
+import orjson
+# Note: pandas and Orchestrator are imported lazily where they are used
+# so pages without post history (or without a manual run) skip the import cost
 
 # Page Config
 st.set_page_config(
@@ -12,12 +12,40 @@ st.set_page_config(
     layout="wide"
 )
 
+MEMORY_PATH = "memory.json"
+
+# Analytics frame columns, plus defaults for keys missing from a history entry
+HISTORY_COLUMNS = ["Date", "Topic", "Vibe", "Likes", "Comments"]
+HISTORY_DEFAULTS = {"Date": "Unknown", "Topic": "Unknown", "Vibe": "Unknown", "Likes": 0, "Comments": 0}
+HISTORY_DTYPES = {"Topic": "category", "Vibe": "category", "Likes": "int32", "Comments": "int32"}
+
+# Above this many posts the engagement chart is LTTB-downsampled before rendering
+LINE_CHART_MAX_POINTS = 500
+
+# Raw history table shows only the most recent rows (slider bounds)
+RAW_HISTORY_MIN_ROWS = 10
+RAW_HISTORY_DEFAULT_ROWS = 50
+RAW_HISTORY_MAX_ROWS = 1000
+
 # --- Helper Functions ---
-def load_memory():
+# Only the latest mtime is ever requested again, so one entry is enough
+@st.cache_data(show_spinner=False, max_entries=1)
+def _read_memory(mtime: float) -> dict:
+    """Parse memory.json. Keyed on mtime so edits invalidate the cache."""
+    with open(MEMORY_PATH, "rb") as f:
+        return orjson.loads(f.read())
+
+def memory_mtime() -> float:
+    """Modification time of memory.json (0.0 if missing); doubles as a cache key."""
+    try:
+        return os.path.getmtime(MEMORY_PATH)
+    except OSError:
+        return 0.0
+
+def load_memory(mtime: float):
     """Load memory data with comprehensive error handling."""
     try:
-        with open("memory.json", "r") as f:
-            return json.load(f)
+        return _read_memory(mtime)
     except FileNotFoundError:
         return {"rules": [], "history": []}
     except json.JSONDecodeError as e:
@@ -30,11 +58,92 @@ def load_memory():
         st.error(f"Unexpected error loading memory: {e}")
         return {"rules": [], "history": []}
 
+@st.cache_data(show_spinner=False, max_entries=1)
+def build_history_frame(_history: list, mtime: float) -> tuple:
+    """Build the analytics DataFrame and headline metrics from post history.
+
+    `_history` is excluded from Streamlit's argument hashing; the memory.json
+    mtime it was loaded at is the cache key instead, and only the latest
+    frame is kept.
+
+    Returns:
+        Tuple of (df, engagement, vibe_stats, total_likes, total_comments, top_vibe)
+        where `engagement` is Likes/Comments indexed by parsed post date, for
+        charting only; `df` keeps the stored date strings for the table.
+    """
+    import pandas as pd
+
+    rows = (
+        (
+            entry.get("date"),
+            entry.get("topic"),
+            entry.get("vibe"),
+            (entry.get("stats") or {}).get("likes"),
+            (entry.get("stats") or {}).get("comments"),
+        )
+        for entry in _history
+    )
+    df = (
+        pd.DataFrame.from_records(rows, columns=HISTORY_COLUMNS)
+        .fillna(HISTORY_DEFAULTS)
+        .astype(HISTORY_DTYPES)
+    )
+    # Non-timestamp dates (e.g. "manual") become NaT and are left off the chart
+    dates = pd.to_datetime(df["Date"], format="ISO8601", errors="coerce", cache=True)
+    engagement = df.loc[dates.notna().to_numpy(), ["Likes", "Comments"]].set_axis(
+        dates.dropna(), axis="index"
+    )
+    total_likes = int(df["Likes"].to_numpy().sum())
+    total_comments = int(df["Comments"].to_numpy().sum())
+    # One groupby feeds both the "Best Vibe" metric and the bar chart
+    vibe_stats = df.groupby("Vibe", sort=False, observed=True)[["Likes", "Comments"]].sum()
+    # With no likes recorded every vibe ties at zero, so there is no "best" one
+    if total_likes > 0:
+        top_vibe = str(vibe_stats.index[vibe_stats["Likes"].to_numpy().argmax()])
+    else:
+        top_vibe = "N/A"
+    return df, engagement, vibe_stats.reset_index(), total_likes, total_comments, top_vibe
+
+def lttb_indices(x, y, n_out: int):
+    """Largest-Triangle-Three-Buckets downsampling.
+
+    Picks `n_out` row indices from the (x, y) series that preserve its visual
+    shape: first and last points are kept, and from each bucket in between the
+    point forming the largest triangle with its neighbours is chosen.
+    """
+    import numpy as np
+
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    bucket_size = (n - 2) / (n_out - 2)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        indices[i + 1] = a
+    return indices
+
 # --- Main Layout ---
 st.title("📈 LinkedIn Growth Machine: Command Center")
 
 # Load Data
-data = load_memory()
+memory_version = memory_mtime()
+data = load_memory(memory_version)
 history = data.get("history", [])
 latest_pack = data.get("latest_comment_pack", None)
 
@@ -53,25 +162,11 @@ st.divider()
 st.header("📊 Performance Analytics")
 
 if history:
-    # Convert history to DataFrame
-    df_data = []
-    for entry in history:
-        df_data.append({
-            "Date": entry.get("date", "Unknown"),
-            "Topic": entry.get("topic", "Unknown"),
-            "Vibe": entry.get("vibe", "Unknown"),
-            "Likes": entry.get("stats", {}).get("likes", 0),
-            "Comments": entry.get("stats", {}).get("comments", 0)
-        })
-    
-    df = pd.DataFrame(df_data)
+    # Convert history to DataFrame (cached across reruns)
+    df, engagement, vibe_stats, total_likes, total_comments, top_vibe = build_history_frame(history, memory_version)
     
     # Metrics
     col1, col2, col3 = st.columns(3)
-    total_likes = df["Likes"].sum()
-    total_comments = df["Comments"].sum()
-    top_vibe = df.groupby("Vibe")["Likes"].sum().idxmax() if not df.empty else "N/A"
-    
     col1.metric("Total Likes", total_likes)
     col2.metric("Total Comments", total_comments)
     col3.metric("🏆 Best Vibe", top_vibe)
@@ -82,18 +177,32 @@ if history:
     with c1:
         st.subheader("Engagement over Time")
         if not df.empty:
-            st.line_chart(df.set_index("Date")[["Likes", "Comments"]])
+            undated = len(df) - len(engagement)
+            if len(engagement) > LINE_CHART_MAX_POINTS:
+                keep = lttb_indices(engagement.index.asi8, engagement["Likes"], LINE_CHART_MAX_POINTS)
+                engagement = engagement.iloc[keep]
+            st.line_chart(engagement)
+            if undated:
+                st.caption(f"{undated} post(s) without a parseable date are not charted.")
             
     with c2:
         st.subheader("Vibe Performance")
         if not df.empty:
-            vibe_stats = df.groupby("Vibe")[["Likes", "Comments"]].sum().reset_index()
-            fig = px.bar(vibe_stats, x="Vibe", y="Likes", color="Vibe", title="Likes by Persona")
-            st.plotly_chart(fig)
+            st.bar_chart(vibe_stats.set_index("Vibe")["Likes"])
 
-    # Raw Data
-    with st.expander("Raw Post History"):
-        st.dataframe(df)
+    # Raw Data (a collapsed expander would still serialize the table every
+    # rerun, so only build it once the user asks for it)
+    if st.toggle("Show Raw Post History"):
+        shown = len(df)
+        if shown > RAW_HISTORY_MIN_ROWS:
+            max_rows = min(shown, RAW_HISTORY_MAX_ROWS)
+            shown = st.slider(
+                "Most recent posts to show",
+                RAW_HISTORY_MIN_ROWS,
+                max_rows,
+                min(RAW_HISTORY_DEFAULT_ROWS, max_rows),
+            )
+        st.dataframe(df.tail(shown), use_container_width=True)
 
 else:
     st.warning("No post history found. The bot needs to run a few times to gather data.")
@@ -117,6 +226,9 @@ with c_left:
             try:
                 # Lazy import to avoid loading on every page view
                 from linkedin_agents import Orchestrator
+                # Fresh per run: agents hold per-run vibe prompts and the LinkedIn
+                # credentials. The costly parts (HTTP session, Groq client) are
+                # already module-level singletons in linkedin_agents.
                 orch = Orchestrator()
                 orch.run_workflow()
                 st.success("✅ Workflow completed! Refresh page to see results.")
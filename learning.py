@@ -21,6 +21,7 @@ from whatever signal the human provides, and degrades gracefully to
 exploration when there is none.
 """
 
+import copy
 import json
 import os
 import random
@@ -54,7 +55,7 @@ class RuleManager:
     def add_rule_capped(self, rule: str) -> None:
         """FIFO-capped replacement for Memory.add_rule()."""
         with self.memory.lock:
-            data = self.memory._load()
+            data = copy.deepcopy(self.memory._load())
             rules = data.get("rules", [])
             if rule in rules:
                 return
@@ -105,7 +106,7 @@ class RuleManager:
             return None
 
         with self.memory.lock:
-            data = self.memory._load()
+            data = copy.deepcopy(self.memory._load())
             data["rules"] = principles
             data["rules_distilled_at"] = datetime.utcnow().isoformat()
             self.memory._save(data)
@@ -1,28 +1,42 @@
 import os
+import copy
 import json
 import random
+import re
+import tempfile
+import threading
 import requests
 import urllib.parse
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 
-from groq import Groq
+import orjson
 import yaml
 from filelock import FileLock
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Load environment variables from .env file (for local development)
 load_dotenv()
 
 # Import structured logging
-from logging_config import logger
+from logging_config import logger, set_log_level
 
 
 # --- Configuration Loading ---
 
+# libyaml-backed loader when available (bundled with PyYAML wheels)
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+
 def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
     """Load configuration from YAML file with defaults."""
     defaults = {
@@ -48,7 +62,7 @@ def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
     try:
         if os.path.exists(config_path):
             with open(config_path, "r") as f:
-                user_config = yaml.safe_load(f) or {}
+                user_config = yaml.load(f, Loader=YamlLoader) or {}
             # Merge with defaults
             for key, value in user_config.items():
                 if isinstance(value, dict) and key in defaults:
@@ -63,6 +77,74 @@ def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
 
 # Load config at module level
 CONFIG = load_config()
+set_log_level(CONFIG.get("logging", {}).get("level"))
+
+
+def env_flag(name: str) -> bool:
+    """Read a boolean environment variable; only 1/true/yes (any case) count as on."""
+    return os.environ.get(name, "").strip().lower() in {"1", "true", "yes"}
+
+
+# --- HTTP Session ---
+
+# (connect, read) seconds for calls that don't pass their own timeout
+DEFAULT_TIMEOUT = (10, 30)
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies DEFAULT_TIMEOUT when a call sets none, so no request can hang a run."""
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = DEFAULT_TIMEOUT
+        return super().send(request, **kwargs)
+
+
+def build_session(retries: int = 3) -> requests.Session:
+    """Create the pooled HTTP session shared by all connectors.
+
+    Keep-alive lets repeated calls to the same host (HackerNews items, the
+    LinkedIn register/upload/post sequence) reuse one TCP+TLS connection.
+    Transient failures are retried by urllib3 with exponential backoff,
+    honouring Retry-After on 429/503; the final response is still returned
+    so callers keep their own status-code handling. Calls without an
+    explicit timeout get DEFAULT_TIMEOUT.
+
+    Connection pools are per host and blocking, so at most
+    `http.max_connections_per_host` requests hit any one API at a time;
+    extra threads wait for a free connection instead of piling on more.
+    """
+    http_cfg = CONFIG.get("http", {})
+    per_host = http_cfg.get("max_connections_per_host", 8)
+    session = requests.Session()
+    # Identify the bot once for every API (arXiv asks clients to do so)
+    session.headers.update({
+        "User-Agent": "linkedin-post-twice-daily/1.0 (+https://github.com/theriskofcollision/linkedin-post-twice-daily)"
+    })
+    # POST stays out of the retried methods (urllib3 default) so a flaky
+    # LinkedIn response can never publish the same post twice.
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = TimeoutHTTPAdapter(
+        pool_connections=http_cfg.get("max_hosts", 20),
+        pool_maxsize=per_host,
+        pool_block=True,
+        max_retries=retry,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+SESSION = build_session()
+# Pollinations renders can take a minute and generate_image already retries
+# with a fresh seed, so transport retries there would only multiply the wait
+IMAGE_SESSION = build_session(retries=0)
 
 
 # --- Data Structures ---
@@ -89,23 +171,80 @@ class ContentDraft:
 
 # --- Memory System ---
 
+def write_json_atomic(path: str, data: Any) -> None:
+    """Write JSON to a temp file in the same directory, then rename it over path.
+
+    A crash or cancelled CI job mid-write leaves the previous file intact
+    instead of a truncated one.
+    """
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates 0600; keep the target's mode (0644 for a new file)
+        # so the rename doesn't make memory.json owner-only
+        try:
+            mode = os.stat(path).st_mode & 0o7777
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
 class Memory:
     """Persistent memory system with file locking for concurrent access."""
     
-    def __init__(self, file_path: str = "memory.json"):
+    def __init__(self, file_path: str = "memory.json", read_only: bool = False):
         self.file_path = file_path
         self.lock = FileLock(f"{file_path}.lock")
+        # Read-only memory (dry runs) keeps writes in-process and never touches disk
+        self.read_only = read_only
+        # Parsed copy of the file plus the (path, mtime, size) stamp it was read at
+        self._data: Optional[Dict[str, Any]] = None
+        self._stamp: Optional[tuple] = None
         
-        if not os.path.exists(self.file_path):
-            self._save({"rules": [], "history": []})
+        # Check under the lock so two instances (or processes) can't both decide
+        # the file is missing and clobber one another
+        if self.read_only:
+            return
+        with self.lock:
+            if not os.path.exists(self.file_path):
+                self._save({"rules": [], "history": []})
+
+    def _file_stamp(self) -> Optional[tuple]:
+        """Identify the on-disk version of the memory file."""
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return None
+        return (self.file_path, stat.st_mtime_ns, stat.st_size)
 
     def _load(self) -> Dict[str, Any]:
-        """Load memory data with file locking."""
+        """Load memory data.
+
+        The parsed data is kept in-process and only re-read when the file
+        changes on disk (e.g. another process or a manual edit). Reads don't
+        take the file lock: writes are atomic renames, so the file is never
+        seen half-written. The returned dict is that shared cache, so treat it
+        as read-only; read-modify-write callers hold the lock and edit a
+        copy.deepcopy() of it, which _save then swaps in.
+        """
         try:
-            with self.lock:
-                with open(self.file_path, "r") as f:
-                    return json.load(f)
-        except json.JSONDecodeError as e:
+            stamp = self._file_stamp()
+            if self._data is not None and stamp == self._stamp:
+                return self._data
+            with open(self.file_path, "rb") as f:
+                data = orjson.loads(f.read())
+            self._data, self._stamp = data, stamp
+            return data
+        except json.JSONDecodeError as e:  # orjson's decode error subclasses this
             logger.error(f"Corrupted memory file: {e}. Resetting to empty.")
             return {"rules": [], "history": []}
         except FileNotFoundError:
@@ -116,9 +255,18 @@ class Memory:
 
     def _save(self, data: Dict[str, Any]) -> None:
         """Save memory data with file locking."""
+        if self.read_only:
+            logger.info("🧠 Memory is read-only (dry run); change kept in-process only.")
+            self._data, self._stamp = data, self._file_stamp()
+            return
         with self.lock:
-            with open(self.file_path, "w") as f:
-                json.dump(data, f, indent=2)
+            try:
+                write_json_atomic(self.file_path, data)
+            except Exception:
+                # Don't serve an in-memory copy that never reached disk
+                self._data, self._stamp = None, None
+                raise
+            self._data, self._stamp = data, self._file_stamp()
 
     def get_rules(self) -> List[str]:
         data = self._load()
@@ -126,7 +274,7 @@ class Memory:
 
     def add_rule(self, rule: str):
         with self.lock:
-            data = self._load()
+            data = copy.deepcopy(self._load())
             if rule not in data["rules"]:
                 data["rules"].append(rule)
                 self._save(data)
@@ -134,7 +282,7 @@ class Memory:
 
     def add_post_history(self, topic: str, vibe: str, urn: str):
         with self.lock:
-            data = self._load()
+            data = copy.deepcopy(self._load())
             if "history" not in data:
                 data["history"] = []
             
@@ -151,7 +299,7 @@ class Memory:
 
     def update_post_stats(self, urn: str, likes: int, comments: int):
         with self.lock:
-            data = self._load()
+            data = copy.deepcopy(self._load())
             for post in data.get("history", []):
                 if post.get("urn") == urn:
                     post["stats"] = {"likes": likes, "comments": comments}
@@ -173,10 +321,11 @@ class Memory:
         return "Not enough data to determine best vibe yet."
 
     def save_comment_pack(self, pack: str):
-        data = self._load()
-        data["latest_comment_pack"] = pack
-        data["last_updated"] = str(os.environ.get("GITHUB_RUN_ID", "manual"))
-        self._save(data)
+        with self.lock:
+            data = copy.deepcopy(self._load())
+            data["latest_comment_pack"] = pack
+            data["last_updated"] = str(os.environ.get("GITHUB_RUN_ID", "manual"))
+            self._save(data)
         logger.info("🧠 Memory Updated: Saved latest Comment Pack.")
 
     def get_manual_feedback(self) -> str:
@@ -210,53 +359,74 @@ class Memory:
             logger.warning(f"Could not read manual feedback: {e}")
             return ""
     
+    @staticmethod
+    def _parse_post_date(value: Any) -> Optional[datetime]:
+        """Parse a history date as a naive local datetime.
+
+        New posts store datetime.now().isoformat(); older entries used a
+        millisecond timestamp string. Returns None for "manual" or anything
+        unparseable.
+        """
+        if isinstance(value, (int, float)) or (isinstance(value, str) and value.isdigit()):
+            try:
+                return datetime.fromtimestamp(int(value) / 1000)
+            except (OverflowError, OSError, ValueError):
+                return None  # Out-of-range timestamp; keep the post
+        if not isinstance(value, str):
+            return None
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone().replace(tzinfo=None)
+        return parsed
+
     def archive_old_posts(self, days: int = 90) -> int:
         """Archive posts older than specified days. Returns count of archived posts."""
-        data = self._load()
-        history = data.get("history", [])
-        
-        if not history:
+        if self.read_only:
             return 0
+        with self.lock:
+            data = copy.deepcopy(self._load())
+            history = data.get("history", [])
         
-        # Calculate cutoff timestamp
-        # Posts use GitHub run ID as date which is a timestamp
-        cutoff = int(time.time() * 1000) - (days * 24 * 60 * 60 * 1000)
+            if not history:
+                return 0
         
-        new_history = []
-        archived = []
+            # Calculate cutoff once for the whole pass
+            cutoff = datetime.now() - timedelta(days=days)
         
-        for post in history:
-            try:
-                post_date = int(post.get("date", 0))
-                if post_date > cutoff or post.get("date") == "manual":
-                    new_history.append(post)
+            new_history = []
+            archived = []
+        
+            for post in history:
+                post_date = self._parse_post_date(post.get("date"))
+                if post_date is None or post_date > cutoff:
+                    new_history.append(post)  # Keep recent, "manual" and unparseable dates
                 else:
                     archived.append(post)
-            except (ValueError, TypeError):
-                new_history.append(post)  # Keep if can't parse date
         
-        if archived:
-            # Save archived posts to separate file
-            archive_path = self.file_path.replace(".json", "_archive.json")
-            try:
-                existing_archive = []
-                if os.path.exists(archive_path):
-                    with open(archive_path, "r") as f:
-                        existing_archive = json.load(f)
+            if archived:
+                # Save archived posts to separate file
+                archive_path = self.file_path.replace(".json", "_archive.json")
+                try:
+                    existing_archive = []
+                    if os.path.exists(archive_path):
+                        with open(archive_path, "rb") as f:
+                            existing_archive = orjson.loads(f.read())
                 
-                existing_archive.extend(archived)
-                with open(archive_path, "w") as f:
-                    json.dump(existing_archive, f, indent=2)
+                    existing_archive.extend(archived)
+                    write_json_atomic(archive_path, existing_archive)
                 
-                logger.info(f"📦 Archived {len(archived)} old posts to {archive_path}")
-            except Exception as e:
-                logger.error(f"Failed to archive posts: {e}")
+                    logger.info(f"📦 Archived {len(archived)} old posts to {archive_path}")
+                except Exception as e:
+                    logger.error(f"Failed to archive posts: {e}")
             
-            # Update main memory
-            data["history"] = new_history
-            self._save(data)
+                # Update main memory
+                data["history"] = new_history
+                self._save(data)
         
-        return len(archived)
+            return len(archived)
     
     def check_token_expiry_warning(self) -> Optional[str]:
         """Check if LinkedIn token might be expiring soon."""
@@ -272,6 +442,66 @@ class Memory:
 
 # --- Base Agent ---
 
+# The groq SDK pulls in httpx/pydantic (~0.3s), so it is imported on first LLM
+# call rather than at module load. Tests patch `linkedin_agents.Groq` directly.
+Groq = None
+
+
+def _groq_client_class():
+    """Return the Groq client class, importing the SDK on first use."""
+    global Groq
+    if Groq is None:
+        from groq import Groq as groq_cls
+        Groq = groq_cls
+    return Groq
+
+
+class RateLimiter:
+    """Thread-safe token bucket shared by every agent's LLM calls.
+
+    Allows bursts up to `per_minute` calls and refills continuously. A 429 seen
+    by one agent calls `backoff()`, which pauses all agents instead of each one
+    discovering the limit on its own.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a call is allowed."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def backoff(self, seconds: float) -> None:
+        """Hold off every caller for at least `seconds`."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+GROQ_LIMITER = RateLimiter(CONFIG.get("model", {}).get("requests_per_minute", 30))
+
+
+@lru_cache(maxsize=4)
+def _groq_client(client_cls, api_key: str):
+    """Build one Groq client per key so its HTTP connection pool is reused across calls."""
+    return client_cls(api_key=api_key)
+
+
 class Agent:
     def __init__(self, name: str, role: str, system_prompt: str):
         self.name = name
@@ -285,7 +515,7 @@ class Agent:
             return f"[{self.name} Output based on '{input_data}']"
 
         logger.info(f"--- {self.name} ({self.role}) Working ---")
-        logger.debug(f"INPUT: {input_data[:200]}...")
+        logger.debug("INPUT: %.200s...", input_data)
         
         max_retries = CONFIG.get("model", {}).get("max_retries", 3)
         base_delay = CONFIG.get("model", {}).get("base_delay_seconds", 5)
@@ -293,12 +523,13 @@ class Agent:
         
         for attempt in range(max_retries):
             try:
-                client = Groq(api_key=api_key)
+                client = _groq_client(_groq_client_class(), api_key)
                 if attempt == 0:
                     logger.info(f"Using model: {model_name}")
                 else:
                     logger.warning(f"Retry attempt {attempt + 1}/{max_retries}")
                 
+                GROQ_LIMITER.acquire()
                 response = client.chat.completions.create(
                     messages=[
                         {"role": "system", "content": self.system_prompt},
@@ -325,7 +556,7 @@ class Agent:
                     if attempt < max_retries - 1:
                         wait_time = base_delay * (2 ** attempt) + random.uniform(0, 1)
                         logger.warning(f"Rate limit hit (429). Waiting {wait_time:.1f}s before retry...")
-                        time.sleep(wait_time)
+                        GROQ_LIMITER.backoff(wait_time)  # acquire() on the retry does the waiting
                         continue
                 
                 logger.error(f"Groq API Error: {e}")
@@ -335,6 +566,22 @@ class Agent:
 class HackerNewsConnector:
     """Connector for fetching AI-related stories from Hacker News."""
 
+    MAX_WORKERS = 10
+    AI_KEYWORDS = ('ai', 'llm', 'gpt', 'agent', 'model', 'neural', 'machine learning',
+                   'robot', 'bot', 'intelligence', 'deepmind', 'openai')
+    # Same case-insensitive substring match as any(k in title.lower()), compiled once
+    AI_TITLE_PATTERN = re.compile("|".join(map(re.escape, AI_KEYWORDS)), re.IGNORECASE)
+
+    def _fetch_item(self, sid: int) -> Dict[str, Any]:
+        """Fetch a single HN item. Returns an empty dict if it can't be fetched."""
+        item_url = f"https://hacker-news.firebaseio.com/v0/item/{sid}.json"
+        try:
+            item_resp = SESSION.get(item_url, timeout=10)
+            return orjson.loads(item_resp.content) or {}
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.debug("Skipping HN item %s: %s", sid, e)
+            return {}
+
     def get_top_ai_stories(self, limit: Optional[int] = None) -> str:
         if limit is None:
             limit = CONFIG.get("sources", {}).get("hackernews", {}).get("ai_results", 5)
@@ -344,30 +591,31 @@ class HackerNewsConnector:
         try:
             # 1. Get Top Stories IDs
             top_stories_url = "https://hacker-news.firebaseio.com/v0/topstories.json"
-            response = requests.get(top_stories_url, timeout=10)
+            response = SESSION.get(top_stories_url, timeout=10)
             response.raise_for_status()
-            story_ids = response.json()[:scan_limit]  # Reduced from 50 to 15
+            story_ids = orjson.loads(response.content)[:scan_limit]  # Reduced from 50 to 15
 
             stories = []
             logger.info(f"Scanning top {len(story_ids)} stories for AI/LLM content...")
-            
-            for sid in story_ids:
-                if len(stories) >= limit:
-                    break
+            if not story_ids:
+                return "No specific AI stories found. Using general knowledge."
+
+            # Fetch items in parallel; map() yields in rank order so the first
+            # `limit` matches are the same stories a serial scan would pick
+            with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(story_ids))) as executor:
+                for item in executor.map(self._fetch_item, story_ids):
+                    title = item.get('title', '')
+                    url = item.get('url', '')
+                    score = item.get('score', 0)
                     
-                item_url = f"https://hacker-news.firebaseio.com/v0/item/{sid}.json"
-                item_resp = requests.get(item_url)
-                item = item_resp.json()
-                
-                title = item.get('title', '')
-                url = item.get('url', '')
-                score = item.get('score', 0)
-                
-                # Simple keyword filter
-                keywords = ['ai', 'llm', 'gpt', 'agent', 'model', 'neural', 'machine learning', 'robot', 'bot', 'intelligence', 'deepmind', 'openai']
-                if any(k in title.lower() for k in keywords):
-                    stories.append(f"- Title: {title}\n  URL: {url}\n  Score: {score}")
-                    logger.debug(f"Found: {title}")
+                    if self.AI_TITLE_PATTERN.search(title):
+                        stories.append(f"- Title: {title}\n  URL: {url}\n  Score: {score}")
+                        logger.debug("Found: %s", title)
+
+                    if len(stories) >= limit:
+                        # Drop fetches that haven't started yet
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
 
             if not stories:
                 return "No specific AI stories found. Using general knowledge."
@@ -387,7 +635,10 @@ class HackerNewsConnector:
 class NewsAPIConnector:
     """Connector for fetching technology headlines from NewsAPI."""
 
-    def get_tech_headlines(self, limit: int = 5) -> str:
+    def get_tech_headlines(self, limit: Optional[int] = None) -> str:
+        if limit is None:
+            limit = CONFIG.get("sources", {}).get("newsapi", {}).get("limit", 5)
+        
         logger.info("--- NewsAPI Connector Working ---")
         api_key = os.environ.get("NEWS_API_KEY")
         if not api_key:
@@ -396,11 +647,12 @@ class NewsAPIConnector:
 
         try:
             # Fetch top tech headlines (API key in header for security)
-            url = "https://newsapi.org/v2/top-headlines?category=technology&language=en&pageSize=10"
+            # Only ask for as many articles as we'll keep
+            url = f"https://newsapi.org/v2/top-headlines?category=technology&language=en&pageSize={limit}"
             headers = {"X-Api-Key": api_key}
-            response = requests.get(url, headers=headers, timeout=10)
+            response = SESSION.get(url, headers=headers, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             articles = []
             logger.info(f"Scanning {len(data.get('articles', []))} articles from NewsAPI...")
@@ -411,7 +663,7 @@ class NewsAPIConnector:
                 source = article.get('source', {}).get('name', 'Unknown')
                 
                 articles.append(f"- Title: {title}\n  Source: {source}\n  URL: {url}")
-                logger.debug(f"Found: {title}")
+                logger.debug("Found: %s", title)
 
             if not articles:
                 return "No recent tech headlines found."
@@ -425,37 +677,45 @@ class NewsAPIConnector:
 class ArxivConnector:
     """Connector for fetching latest AI/ML papers from arXiv."""
 
-    def get_latest_papers(self, limit: int = 3) -> str:
+    def get_latest_papers(self, limit: Optional[int] = None) -> str:
+        if limit is None:
+            limit = CONFIG.get("sources", {}).get("arxiv", {}).get("limit", 3)
+        
         logger.info("--- arXiv Connector Working ---")
         try:
             # Search for AI/LLM papers
             # cat:cs.AI = Computer Science AI
             # sortBy=submittedDate&sortOrder=descending
-            url = "http://export.arxiv.org/api/query?search_query=cat:cs.AI+OR+cat:cs.CL&start=0&max_results=5&sortBy=submittedDate&sortOrder=descending"
-            response = requests.get(url)
+            # Only ask arXiv for as many entries as we'll keep
+            url = f"http://export.arxiv.org/api/query?search_query=cat:cs.AI+OR+cat:cs.CL&start=0&max_results={limit}&sortBy=submittedDate&sortOrder=descending"
             
             # Use defusedxml to prevent XML entity attacks (billion laughs, XXE)
             import defusedxml.ElementTree as ET
-            root = ET.fromstring(response.content)
             
             # Namespace map
             ns = {'atom': 'http://www.w3.org/2005/Atom'}
+            entry_tag = '{http://www.w3.org/2005/Atom}entry'
             
             papers = []
             logger.info("Scanning arXiv for latest papers...")
             
-            count = 0
-            for entry in root.findall('atom:entry', ns):
-                if count >= limit:
-                    break
-                
-                title = entry.find('atom:title', ns).text.strip().replace('\n', ' ')
-                link = entry.find('atom:id', ns).text.strip()
-                summary = entry.find('atom:summary', ns).text.strip().replace('\n', ' ')[:200] + "..."
-                
-                papers.append(f"- Title: {title}\n  URL: {link}\n  Abstract: {summary}")
-                logger.debug(f"Found Paper: {title[:50]}...")
-                count += 1
+            # Parse entries as they arrive and stop reading once we have enough
+            with SESSION.get(url, stream=True, timeout=10) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                for _, entry in ET.iterparse(response.raw, events=('end',)):
+                    if entry.tag != entry_tag:
+                        continue
+                    
+                    title = entry.find('atom:title', ns).text.strip().replace('\n', ' ')
+                    link = entry.find('atom:id', ns).text.strip()
+                    summary = entry.find('atom:summary', ns).text.strip().replace('\n', ' ')[:200] + "..."
+                    entry.clear()
+                    
+                    papers.append(f"- Title: {title}\n  URL: {link}\n  Abstract: {summary}")
+                    logger.debug("Found Paper: %.50s...", title)
+                    if len(papers) >= limit:
+                        break
 
             if not papers:
                 return "No recent arXiv papers found."
@@ -486,8 +746,8 @@ class TavilyConnector:
                 "include_images": include_images,
                 "max_results": 3
             }
-            response = requests.post(url, json=payload)
-            data = response.json()
+            response = SESSION.post(url, json=payload)
+            data = orjson.loads(response.content)
             
             results = []
             if data.get("answer"):
@@ -567,29 +827,27 @@ Make it dense, factual, and high-signal."""
                 try:
                     source, data = future.result(timeout=30)
                     results[source] = data
-                    logger.debug(f"✓ {source} data fetched")
+                    logger.debug("✓ %s data fetched", source)
                 except Exception as e:
                     logger.warning(f"Failed to fetch from a source: {e}")
 
-        # Extract results with fallbacks
-        hn_data = results.get("hackernews", "HackerNews data unavailable.")
-        news_data = results.get("newsapi", "NewsAPI data unavailable.")
-        arxiv_data = results.get("arxiv", "arXiv data unavailable.")
-        tavily_data = results.get("tavily", "Tavily data unavailable.")
-
-        full_input = (
-            f"{input_data}\n\n"
-            f"REAL-TIME HACKERNEWS DATA:\n{hn_data}\n\n"
-            f"REAL-TIME NEWSAPI DATA:\n{news_data}\n\n"
-            f"LATEST ACADEMIC PAPERS (ARXIV):\n{arxiv_data}\n\n"
-            f"DEEP WEB SEARCH (TAVILY):\n{tavily_data}"
+        # Skip sources that failed or came back empty so they don't cost prompt tokens
+        sections = [
+            ("REAL-TIME HACKERNEWS DATA", results.get("hackernews")),
+            ("REAL-TIME NEWSAPI DATA", results.get("newsapi")),
+            ("LATEST ACADEMIC PAPERS (ARXIV)", results.get("arxiv")),
+            ("DEEP WEB SEARCH (TAVILY)", results.get("tavily")),
+        ]
+        full_input = "\n\n".join(
+            [input_data] + [f"{heading}:\n{body}" for heading, body in sections
+                            if body and not body.startswith("Error")]
         )
         return super().run(full_input)
 
 # --- Style & Variety Engine ---
 
 STYLE_MATRIX = {
-    "mediums": [
+    "mediums": (
         # Photography styles (professional, editorial)
         "Editorial magazine photography", "Documentary photography", "Portrait photography with shallow depth of field",
         "Street photography candid shot", "Product photography on white background", "Architectural photography",
@@ -603,8 +861,8 @@ STYLE_MATRIX = {
         # Unique but tasteful
         "Paper cut-out layered art", "Woodblock print Japanese style", "Risograph print texture",
         "Vintage poster 1960s style", "Blueprint technical drawing", "Botanical scientific illustration"
-    ],
-    "lighting": [
+    ),
+    "lighting": (
         # Natural lighting (most professional)
         "Soft natural window light", "Golden hour warm sunlight", "Overcast diffused daylight",
         "Morning blue hour soft light", "Dappled sunlight through trees", "Clean studio softbox lighting",
@@ -613,8 +871,8 @@ STYLE_MATRIX = {
         "Backlit silhouette rim light", "Soft fill light minimal shadows", "Side lighting texture emphasis",
         # Atmospheric
         "Foggy atmospheric haze", "Warm tungsten indoor glow", "Cool shade open shadow"
-    ],
-    "palettes": [
+    ),
+    "palettes": (
         # Professional and clean
         "Clean white with navy accents", "Warm neutrals (beige, cream, tan)", "Cool greys with teal accent",
         "Black and white high contrast", "Muted earth tones (sage, terracotta, sand)",
@@ -624,10 +882,10 @@ STYLE_MATRIX = {
         # Subtle and sophisticated
         "Dusty rose and grey", "Ocean blues gradient", "Sunset warm oranges and coral",
         "Vintage faded film tones", "Coffee browns and cream"
-    ]
+    )
 }
 
-POST_FORMATS = [
+POST_FORMATS = (
     "The Paradox: Start with two conflicting truths.",
     "The 3-Step Guide: Direct, actionable value.",
     "The Manifesto: A bold declaration of beliefs.",
@@ -645,38 +903,38 @@ POST_FORMATS = [
     "The Comparison: Post-A vs Post-B framework.",
     "The 'Unpopular Opinion': Highlighting a hidden truth.",
     "The Technical Teardown: How it actually works under the hood."
-]
+)
 
 # --- Hashtag Strategy ---
 # Curated pools mixed by category. 3-5 are randomly picked per post.
 HASHTAG_POOLS = {
-    "broad": [
+    "broad": (
         "#AI", "#ArtificialIntelligence", "#MachineLearning", "#DeepLearning",
         "#Tech", "#Technology", "#Innovation", "#FutureOfWork",
         "#DataScience", "#Automation"
-    ],
-    "agentic": [
+    ),
+    "agentic": (
         "#AgenticAI", "#MultiAgentSystems", "#AIAgents", "#AutonomousAI",
         "#FlowEngineering", "#AIOrchestration", "#LLMAgents"
-    ],
-    "developer": [
+    ),
+    "developer": (
         "#SoftwareEngineering", "#Coding", "#DevTools", "#OpenSource",
         "#Programming", "#BuildInPublic", "#TechCommunity"
-    ],
-    "business": [
+    ),
+    "business": (
         "#DigitalTransformation", "#Startups", "#Entrepreneurship",
         "#ProductManagement", "#Leadership", "#BusinessStrategy"
-    ],
-    "career": [
+    ),
+    "career": (
         "#CareerGrowth", "#TechCareers", "#Upskilling", "#FutureSkills",
         "#PersonalDevelopment", "#LifelongLearning"
-    ]
+    )
 }
+ALL_HASHTAGS = tuple(t for pool in HASHTAG_POOLS.values() for t in pool)
 
 
 def pick_hashtags(topic: str = "", count: int = 4) -> str:
     """Pick a smart mix of hashtags based on topic."""
-    import random
     tags = set()
     
     # Always 1 broad tag
@@ -698,9 +956,8 @@ def pick_hashtags(topic: str = "", count: int = 4) -> str:
         tags.add(random.choice(HASHTAG_POOLS["developer"]))
     
     # Fill remaining with random picks from any pool
-    all_tags = [t for pool in HASHTAG_POOLS.values() for t in pool]
     while len(tags) < count:
-        tags.add(random.choice(all_tags))
+        tags.add(random.choice(ALL_HASHTAGS))
     
     return "\n\n" + " ".join(list(tags)[:count])
 
@@ -804,6 +1061,8 @@ VIBES = {
     },
 }
 
+VIBE_NAMES = tuple(VIBES)
+
 # --- Specific Agents ---
 
 # ... (Connectors remain the same) ...
@@ -822,21 +1081,7 @@ Current Persona: {vibe_name}
 {vibe_prompt}"""
 
 class Ghostwriter(Agent):
-    def __init__(self):
-        self.memory = Memory()
-        super().__init__(
-            name="Ghostwriter",
-            role="Content Writer",
-            system_prompt="You are a viral LinkedIn Creator." # Placeholder
-        )
-
-    def set_vibe(self, vibe_name: str, vibe_prompt: str, post_format: str = ""):
-        self.system_prompt = f"""Write a LinkedIn post. Output ONLY the post text. Nothing else.
-
-Style: {vibe_name}
-{vibe_prompt}
-
-Inspiration: {post_format}
+    BASE_PROMPT = """Write a LinkedIn post. Output ONLY the post text. Nothing else.
 
 THE GOLDEN RULE: Write like you're texting a smart friend at 11pm. Casual. Real. Positive. Bring GOOD VIBES. Make people smile. NO lecturing. NO teaching. NO telling people what to do.
 
@@ -906,6 +1151,24 @@ BAD EXAMPLES (NEVER write like this):
 
 Vary length between 80-250 chars. Super short OR medium, never long. Good vibes only. Just the post text, nothing else."""
 
+    def __init__(self, memory: Optional[Memory] = None):
+        self.memory = memory or Memory()
+        super().__init__(
+            name="Ghostwriter",
+            role="Content Writer",
+            system_prompt="You are a viral LinkedIn Creator." # Placeholder
+        )
+
+    def set_vibe(self, vibe_name: str, vibe_prompt: str, post_format: str = ""):
+        # Static rules first, per-run persona last: providers cache prompts by
+        # prefix, so the long shared part stays identical across runs
+        self.system_prompt = f"""{self.BASE_PROMPT}
+
+Style: {vibe_name}
+{vibe_prompt}
+
+Inspiration: {post_format}"""
+
     def run(self, input_data: str) -> str:
         # Inject Memory into the prompt
         rules = self.memory.get_rules()
@@ -917,6 +1180,42 @@ Vary length between 80-250 chars. Super short OR medium, never long. Good vibes
         return super().run(full_input)
 
 class ArtDirector(Agent):
+    # NUCLEAR APPROACH: Pollinations ignores "no faces" negative prompts.
+    # Instead of filtering the AI prompt, we use HARDCODED safe prompts
+    # that can NEVER produce portraits. The AI's concept is only used
+    # to pick a category.
+    SAFE_PROMPTS = (
+        # Tech/workspace
+        "minimalist desk with laptop and coffee cup, morning light, editorial photography, clean composition",
+        "close up of mechanical keyboard with RGB lighting, dark background, product photography",
+        "server room with rows of blinking LED lights, blue and green glow, wide angle",
+        "whiteboard covered in diagrams and sticky notes, office setting, natural light",
+        "code on a dark monitor screen, shallow depth of field, moody lighting",
+        "stack of notebooks and pen on wooden desk, overhead shot, warm tones",
+        "modern workspace with dual monitors showing code, plants, minimal decor",
+        "vintage typewriter next to modern laptop, contrast of old and new technology",
+        "circuit board macro photography, electronic components, blue and gold tones",
+        "fiber optic cables glowing with data, abstract technology, dark background",
+        # Nature/abstract
+        "aerial view of winding river through green forest, drone photography",
+        "ocean waves crashing on rocky shore at golden hour, long exposure",
+        "single tree on hilltop at sunrise, minimalist landscape, fog",
+        "abstract flowing water with light reflections, long exposure photography",
+        "mountain peak above clouds at dawn, dramatic sky, landscape photography",
+        "rain drops on glass window with city lights bokeh in background",
+        "desert sand dunes with dramatic shadows, aerial view, golden hour",
+        "frozen lake with cracks pattern, overhead drone shot, winter landscape",
+        # Data/abstract
+        "abstract data visualization with flowing lines and nodes, dark background, blue accents",
+        "geometric patterns with light and shadow, architectural abstract, black and white",
+        "light painting photography, abstract streaks of color on black background",
+        "stacked books with reading glasses on top, warm library lighting",
+        "chess pieces on board, dramatic side lighting, strategy concept",
+        "hourglass with flowing sand, macro photography, time concept",
+        "compass on old map, warm vintage tones, navigation concept",
+        "telescope pointed at starry night sky, astrophotography",
+    )
+
     def __init__(self):
         super().__init__(
             name="ArtDirector",
@@ -972,74 +1271,41 @@ Text Overlay: [Optional - only if truly needed]"""
     def generate_image(self, prompt: str) -> Optional[bytes]:
         logger.info(f"--- {self.name} ({self.role}) Working ---")
         
-        # NUCLEAR APPROACH: Pollinations ignores "no faces" negative prompts.
-        # Instead of filtering the AI prompt, we use HARDCODED safe prompts
-        # that can NEVER produce portraits. The AI's concept is only used
-        # to pick a category.
-        import random
-        
-        SAFE_PROMPTS = [
-            # Tech/workspace
-            "minimalist desk with laptop and coffee cup, morning light, editorial photography, clean composition",
-            "close up of mechanical keyboard with RGB lighting, dark background, product photography",
-            "server room with rows of blinking LED lights, blue and green glow, wide angle",
-            "whiteboard covered in diagrams and sticky notes, office setting, natural light",
-            "code on a dark monitor screen, shallow depth of field, moody lighting",
-            "stack of notebooks and pen on wooden desk, overhead shot, warm tones",
-            "modern workspace with dual monitors showing code, plants, minimal decor",
-            "vintage typewriter next to modern laptop, contrast of old and new technology",
-            "circuit board macro photography, electronic components, blue and gold tones",
-            "fiber optic cables glowing with data, abstract technology, dark background",
-            # Nature/abstract
-            "aerial view of winding river through green forest, drone photography",
-            "ocean waves crashing on rocky shore at golden hour, long exposure",
-            "single tree on hilltop at sunrise, minimalist landscape, fog",
-            "abstract flowing water with light reflections, long exposure photography",
-            "mountain peak above clouds at dawn, dramatic sky, landscape photography",
-            "rain drops on glass window with city lights bokeh in background",
-            "desert sand dunes with dramatic shadows, aerial view, golden hour",
-            "frozen lake with cracks pattern, overhead drone shot, winter landscape",
-            # Data/abstract
-            "abstract data visualization with flowing lines and nodes, dark background, blue accents",
-            "geometric patterns with light and shadow, architectural abstract, black and white",
-            "light painting photography, abstract streaks of color on black background",
-            "stacked books with reading glasses on top, warm library lighting",
-            "chess pieces on board, dramatic side lighting, strategy concept",
-            "hourglass with flowing sand, macro photography, time concept",
-            "compass on old map, warm vintage tones, navigation concept",
-            "telescope pointed at starry night sky, astrophotography",
-        ]
-        
-        chosen_prompt = random.choice(SAFE_PROMPTS)
+        chosen_prompt = random.choice(self.SAFE_PROMPTS)
         logger.info(f"Using safe prompt: {chosen_prompt[:60]}...")
 
-        import time
-        seed = random.randint(1, 999999)
-        encoded_prompt = urllib.parse.quote(chosen_prompt)
-        url = f"https://image.pollinations.ai/prompt/{encoded_prompt}?width=1200&height=628&nologo=true&seed={seed}"
+        # Prompt and size are fixed; each attempt rolls a new seed
+        url = f"https://image.pollinations.ai/prompt/{urllib.parse.quote(chosen_prompt)}"
+        params = {"width": 1200, "height": 628, "nologo": "true"}
         
         max_retries = 3
         for attempt in range(max_retries):
+            params["seed"] = random.randint(1, 999999)
             try:
-                logger.info(f"Attempt {attempt + 1}/{max_retries}: Pollinations.ai (seed={seed})...")
-                response = requests.get(url, timeout=90)
-                
-                if response.status_code == 429:
-                    wait = (attempt + 1) * 10
-                    logger.warning(f"Rate limited (429). Waiting {wait}s...")
-                    time.sleep(wait)
-                    seed = random.randint(1, 999999)
-                    url = f"https://image.pollinations.ai/prompt/{encoded_prompt}?width=1200&height=628&nologo=true&seed={seed}"
-                    continue
-                
-                response.raise_for_status()
-                
-                content_type = response.headers.get("content-type", "")
-                if "image" in content_type and len(response.content) > 5000:
-                    logger.info(f"✅ Image generated: {len(response.content)} bytes")
-                    return response.content
-                else:
-                    logger.warning(f"Invalid response: type={content_type}, size={len(response.content)}")
+                logger.info(f"Attempt {attempt + 1}/{max_retries}: Pollinations.ai (seed={params['seed']})...")
+                # Stream so the body is only downloaded once the headers look like an image
+                # Fail fast on connect; only the render itself gets the long read timeout
+                response = IMAGE_SESSION.get(url, params=params, timeout=(DEFAULT_TIMEOUT[0], 90), stream=True)
+                try:
+                    if response.status_code == 429:
+                        wait = (attempt + 1) * 10
+                        logger.warning(f"Rate limited (429). Waiting {wait}s...")
+                        time.sleep(wait)
+                        continue
+                    
+                    response.raise_for_status()
+                    
+                    content_type = response.headers.get("content-type", "")
+                    if "image" not in content_type:
+                        logger.warning(f"Invalid response: type={content_type}")
+                    else:
+                        image_data = response.content
+                        if len(image_data) > 5000:
+                            logger.info(f"✅ Image generated: {len(image_data)} bytes")
+                            return image_data
+                        logger.warning(f"Invalid response: type={content_type}, size={len(image_data)}")
+                finally:
+                    response.close()
                     
             except Exception as e:
                 logger.warning(f"Pollinations attempt {attempt + 1} failed: {e}")
@@ -1053,8 +1319,16 @@ Text Overlay: [Optional - only if truly needed]"""
         return None
 
 class Critic(Agent):
-    def __init__(self):
-        self.memory = Memory()
+    # Cheap local check for the prompt's most common instant rejects (buzzwords,
+    # percentages, "10x") in the post text; a hit skips the LLM round trip entirely
+    BANNED_PATTERN = re.compile(
+        r"\b(?:synergy|leverage|ecosystem|scalable|robust|streamline|optimize|paradigm|innovative"
+        r"|cutting-edge|game-changer|revolutionize|empower|unlock|harness)\b|\b\d+(?:\.\d+)?\s*%|\b\d+x\b",
+        re.IGNORECASE,
+    )
+
+    def __init__(self, memory: Optional[Memory] = None):
+        self.memory = memory or Memory()
         super().__init__(
             name="Critic",
             role="Quality Control",
@@ -1087,8 +1361,21 @@ If you find a pattern to remember, output: "RULE: [the pattern to avoid]"
 Rate: PASS or REJECT with one-line reason."""
         )
 
-    def run(self, input_data: str) -> str:
-        feedback = super().run(input_data)
+    def run(self, input_data: str, draft_text: Optional[str] = None) -> str:
+        # Only the post itself is checked: the visual concept in input_data can
+        # legitimately say "30% negative space". A hit still teaches a rule (one
+        # per buzzword, one shared rule for all stats) so the next draft avoids it.
+        hit = self.BANNED_PATTERN.search(draft_text) if draft_text else None
+        if hit:
+            banned = hit.group(0).lower()
+            logger.info(f"Critic: local ban hit on '{banned}', skipping LLM review")
+            if banned[0].isdigit():
+                rule = "No stats, percentages or multipliers (like '35%' or '10x')"
+            else:
+                rule = f"Never use the word '{banned}'"
+            feedback = f"REJECT: uses banned phrase '{banned}'\nRULE: {rule}"
+        else:
+            feedback = super().run(input_data)
         
         # Handle case where API call failed
         if not feedback:
@@ -1151,9 +1438,14 @@ class OrganicImageSearcher:
             lucky_url = random.choice(image_urls[:3])
             logger.info(f"Found organic image: {lucky_url}")
             
-            img_resp = requests.get(lucky_url, timeout=30)
-            img_resp.raise_for_status()
-            return img_resp.content
+            with SESSION.get(lucky_url, timeout=30, stream=True) as img_resp:
+                img_resp.raise_for_status()
+                # Hotlink-protected hosts often answer with an HTML page; skip the download
+                content_type = img_resp.headers.get("content-type", "")
+                if "image" not in content_type:
+                    logger.warning(f"Organic image URL returned {content_type or 'unknown type'}, skipping.")
+                    return None
+                return img_resp.content
             
         except Exception as e:
             logger.error(f"Organic search failed: {e}")
@@ -1180,7 +1472,7 @@ class LinkedInConnector:
                 "owner": self.author_urn
             }
         }
-        response = requests.post(url, headers=headers, json=payload)
+        response = SESSION.post(url, headers=headers, json=payload)
         response.raise_for_status()
         data = response.json()
         
@@ -1191,7 +1483,7 @@ class LinkedInConnector:
     def upload_image(self, upload_url, image_data):
         """Step 2: Upload the binary image data"""
         headers = {"Authorization": f"Bearer {self.access_token}"}
-        response = requests.put(upload_url, headers=headers, data=image_data)
+        response = SESSION.put(upload_url, headers=headers, data=image_data)
         response.raise_for_status()
 
     def post_content(self, text: str, image_data: bytes = None) -> Optional[str]:
@@ -1247,7 +1539,7 @@ class LinkedInConnector:
             }
 
         try:
-            response = requests.post(url, headers=headers, json=post_data)
+            response = SESSION.post(url, headers=headers, json=post_data)
             response.raise_for_status()
             logger.info(f"✅ Successfully posted to LinkedIn! Status: {response.status_code}")
             
@@ -1298,7 +1590,7 @@ class LinkedInConnector:
         }
         
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = SESSION.get(url, headers=headers, timeout=30)
             if response.status_code in (404, 426):
                 logger.warning(f"Stats not available for {urn} (status={response.status_code})")
                 return {"likes": 0, "comments": 0}
@@ -1327,17 +1619,19 @@ class LinkedInConnector:
 
 class Orchestrator:
     def __init__(self):
+        self.dry_run = env_flag("DRY_RUN")  # Run every agent but never post or write memory
+        # Shared by the orchestrator, Ghostwriter and Critic
+        self.memory = Memory(read_only=self.dry_run)
         self.research_manager = ResearchManager()
         self.strategist = Strategist()
-        self.ghostwriter = Ghostwriter()
+        self.ghostwriter = Ghostwriter(memory=self.memory)
         self.art_director = ArtDirector()
         self.organic_searcher = OrganicImageSearcher()
-        self.critic = Critic()
-        self.image_gen = ArtDirector() # Using ArtDirector as the image gen manager
+        self.critic = Critic(memory=self.memory)
         self.linkedin = LinkedInConnector()
-        self.memory = Memory() # Direct access to memory for orchestrator
         self.networker = Networker()
         self.config = CONFIG # Global config from top of file
+        self.dry_run_draft: Optional[str] = None  # Final text a dry run would have posted
 
     def review_past_performance(self) -> None:
         """Review past post performance (disabled for personal profile mode)."""
@@ -1358,7 +1652,7 @@ class Orchestrator:
             vibe_name = forced_vibe
         else:
             enabled = variety_cfg.get("enabled_personas", "all")
-            candidates = list(VIBES.keys()) if enabled == "all" else list(enabled)
+            candidates = VIBE_NAMES if enabled == "all" else list(enabled)
             from learning import VibeBandit
             vibe_name = VibeBandit().select(candidates)
 
@@ -1402,13 +1696,14 @@ class Orchestrator:
             logger.error("Workflow Aborted: Research failed.")
             return None, None
 
-        # Generate comment pack for networking
+        return topic_query, trend_brief
+
+    def _networking_phase(self, trend_brief: str) -> None:
+        """Generate and store the comment pack for networking."""
         comment_pack = self.networker.run(trend_brief)
         if comment_pack:
             self.memory.save_comment_pack(comment_pack)
 
-        return topic_query, trend_brief
-
     def _strategy_phase(self, trend_brief: str) -> Optional[str]:
         """Execute strategy phase.
 
@@ -1427,11 +1722,13 @@ class Orchestrator:
         Returns:
             Tuple of (draft_text, visual_concept) or (None, None) on failure
         """
-        logger.info("✍️ Drafting Post...")
-        draft_text = self.ghostwriter.run(strategy)
-
-        logger.info("🎨 Designing Visuals...")
-        visual_concept = self.art_director.run(strategy)
+        # Both only depend on the strategy, so run the two LLM calls side by side
+        logger.info("✍️ Drafting Post & 🎨 Designing Visuals...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            draft_future = executor.submit(self.ghostwriter.run, strategy)
+            visual_future = executor.submit(self.art_director.run, strategy)
+            draft_text = draft_future.result()
+            visual_concept = visual_future.result()
 
         if not draft_text:
             logger.error("Workflow Aborted: Ghostwriting failed.")
@@ -1439,14 +1736,13 @@ class Orchestrator:
 
         return draft_text, visual_concept
 
-    def _visual_phase(self, vibe_config: Dict[str, Any], variety_cfg: Dict[str, Any],
-                      topic_query: str, visual_concept: str) -> Optional[bytes]:
-        """Source or generate visual content.
+    def _organic_visual(self, vibe_config: Dict[str, Any], variety_cfg: Dict[str, Any],
+                        topic_query: str) -> Optional[bytes]:
+        """Source a real photo for organic vibes. Only needs the topic.
 
         Returns:
             Image data bytes or None
         """
-        image_data = None
         use_organic = False
         image_pref = variety_cfg.get("image_mode_preference", "hybrid")
 
@@ -1457,10 +1753,18 @@ class Orchestrator:
                 if random.random() < variety_cfg.get("organic_vibe_threshold", 0.5):
                     use_organic = True
 
-        if use_organic:
-            logger.info("🌿 Sourcing Organic Visual...")
-            image_data = self.organic_searcher.get_organic_image(topic_query)
+        if not use_organic:
+            return None
+
+        logger.info("🌿 Sourcing Organic Visual...")
+        return self.organic_searcher.get_organic_image(topic_query)
+
+    def _visual_phase(self, visual_concept: str, image_data: Optional[bytes]) -> Optional[bytes]:
+        """Fall back to a generated image when no organic one was found.
 
+        Returns:
+            Image data bytes or None
+        """
         if not image_data and self.config.get("features", {}).get("enable_image_generation"):
             logger.info("🤖 Generating AI Visual...")
             image_prompt = f"Generate image: {visual_concept}"
@@ -1476,12 +1780,23 @@ class Orchestrator:
         Returns:
             Post URN or None
         """
-        # Review
+        # Review. The verdict doesn't gate publishing (the Critic only learns
+        # rules for future runs), so let it run while we post
         full_package = f"{draft_text}\n\n(Visual: {visual_concept})"
-        self.critic.run(full_package)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            critic_future = executor.submit(self.critic.run, full_package, draft_text)
+            post_urn = self._post(draft_text, image_data, topic_query, vibe_name)
+            try:
+                critic_future.result()
+            except Exception as e:
+                logger.warning(f"Critic review failed: {e}")
 
+        return post_urn
+
+    def _post(self, draft_text: str, image_data: Optional[bytes],
+              topic_query: str, vibe_name: str) -> Optional[str]:
+        """Sanitize, tag and publish the draft, then record it in memory."""
         # HARD-CODED SANITIZER: Strip any AI artifacts that slip through
-        import re
         # Remove asterisk emphasis (*word* or **word**)
         draft_text = re.sub(r'\*{1,2}([^*]+)\*{1,2}', r'\1', draft_text)
         # Remove any remaining stray asterisks
@@ -1492,6 +1807,11 @@ class Orchestrator:
         draft_text += hashtags
         logger.info(f"📌 Hashtags appended: {hashtags.strip()}")
         
+        if self.dry_run:
+            logger.info(f"DRY_RUN set, not posting. Final draft:\n{draft_text}")
+            self.dry_run_draft = draft_text
+            return None
+
         # Publish
         logger.info("✅ Preparing to Post...")
         post_urn = self.linkedin.post_content(draft_text, image_data)
@@ -1512,6 +1832,13 @@ class Orchestrator:
             Post URN if successful, None otherwise
         """
         logger.info("🚀 Starting LinkedIn Growth Workflow (V2: Variety Engine)")
+        self.dry_run_draft = None
+
+        # Without credentials post_content would only skip at the very end, after
+        # every LLM and image call; DRY_RUN=1 runs the pipeline but never posts
+        if not (self.linkedin.access_token and self.linkedin.author_urn) and not self.dry_run:
+            logger.error("Missing LinkedIn credentials. Set DRY_RUN=1 to run the workflow without posting.")
+            return None
 
         # Step 0: Review past performance
         self.review_past_performance()
@@ -1528,18 +1855,27 @@ class Orchestrator:
         if not trend_brief:
             return None
 
-        # Step 4: Strategy phase
-        strategy = self._strategy_phase(trend_brief)
-        if not strategy:
-            return None
+        # The organic photo search only needs the topic, so start it now and
+        # let it overlap strategy and drafting
+        with ThreadPoolExecutor(max_workers=1) as prefetch:
+            organic_image = prefetch.submit(self._organic_visual, vibe_config, variety_cfg, topic_query)
+
+            # Step 4: Strategy phase, with the comment pack drafted alongside
+            # (it only needs the trend brief)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                networking = executor.submit(self._networking_phase, trend_brief)
+                strategy = self._strategy_phase(trend_brief)
+                networking.result()
+            if not strategy:
+                return None
 
-        # Step 5: Content creation phase
-        draft_text, visual_concept = self._content_phase(strategy)
-        if not draft_text:
-            return None
+            # Step 5: Content creation phase
+            draft_text, visual_concept = self._content_phase(strategy)
+            if not draft_text:
+                return None
 
-        # Step 6: Visual sourcing phase
-        image_data = self._visual_phase(vibe_config, variety_cfg, topic_query, visual_concept)
+            # Step 6: Visual sourcing phase
+            image_data = self._visual_phase(visual_concept, organic_image.result())
 
         # Step 7: Publish phase
         return self._publish_phase(draft_text, visual_concept, image_data, topic_query, vibe_name)
@@ -1567,7 +1903,12 @@ if __name__ == "__main__":
         # Run the main workflow
         post_urn = orch.run_workflow()
         
-        if not post_urn:
+        if orch.dry_run and orch.dry_run_draft is not None:
+            logger.info("✅ Dry run completed; nothing was posted.")
+        elif orch.dry_run:
+            logger.error("❌ Dry run stopped before the publish step.")
+            exit_code = 1
+        elif not post_urn:
             logger.error("❌ Workflow failed to post.")
             exit_code = 1
         else:
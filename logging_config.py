@@ -4,6 +4,7 @@ Provides log levels, formatting, and sensitive data filtering.
 """
 
 import logging
+import os
 import sys
 import re
 from typing import Optional
@@ -13,16 +14,25 @@ class SensitiveDataFilter(logging.Filter):
     """Filter to mask sensitive data in log messages."""
     
     PATTERNS = [
-        (r'Bearer [A-Za-z0-9\-_]+', 'Bearer [REDACTED]'),
-        (r'api_key["\']?\s*[:=]\s*["\']?[A-Za-z0-9\-_]+', 'api_key=[REDACTED]'),
-        (r'token["\']?\s*[:=]\s*["\']?[A-Za-z0-9\-_]+', 'token=[REDACTED]'),
-        (r'urn:li:person:[A-Za-z0-9\-_]+', 'urn:li:person:[REDACTED]'),
+        (re.compile(pattern, re.IGNORECASE), replacement) for pattern, replacement in [
+            (r'Bearer [A-Za-z0-9\-_]+', 'Bearer [REDACTED]'),
+            (r'api_key["\']?\s*[:=]\s*["\']?[A-Za-z0-9\-_]+', 'api_key=[REDACTED]'),
+            (r'token["\']?\s*[:=]\s*["\']?[A-Za-z0-9\-_]+', 'token=[REDACTED]'),
+            (r'urn:li:person:[A-Za-z0-9\-_]+', 'urn:li:person:[REDACTED]'),
+        ]
     ]
     
     def filter(self, record: logging.LogRecord) -> bool:
-        if isinstance(record.msg, str):
-            for pattern, replacement in self.PATTERNS:
-                record.msg = re.sub(pattern, replacement, record.msg, flags=re.IGNORECASE)
+        # Redact the formatted message so lazy %-style args are covered too.
+        # Only runs for records that passed the level check.
+        try:
+            message = record.getMessage()
+        except Exception:
+            # Args don't match the format string; still mask the raw text
+            message = str(record.msg)
+        for pattern, replacement in self.PATTERNS:
+            message = pattern.sub(replacement, message)
+        record.msg, record.args = message, ()
         return True
 
 
@@ -67,5 +77,19 @@ def setup_logging(
     return logger
 
 
-# Create default logger instance
-logger = setup_logging()
+def set_log_level(
+    config_level: Optional[str] = None,
+    name: str = "linkedin_workflow"
+) -> None:
+    """
+    Apply the configured log level to an existing logger.
+    
+    Precedence: LOG_LEVEL env var, then config.yaml's logging.level, then INFO.
+    """
+    level = os.environ.get("LOG_LEVEL") or config_level or "INFO"
+    logging.getLogger(name).setLevel(getattr(logging, str(level).upper(), logging.INFO))
+
+
+# Create default logger instance (LOG_LEVEL=DEBUG enables per-item detail);
+# linkedin_agents re-applies the level once config.yaml is loaded
+logger = setup_logging(os.environ.get("LOG_LEVEL", "INFO"))
@@ -11,7 +11,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from linkedin_agents import (
     Agent, Strategist, Ghostwriter, ArtDirector, Critic,
-    Networker, VIBES
+    Memory, Networker, ResearchManager, RateLimiter, VIBES
 )
 
 
@@ -55,6 +55,77 @@ class TestBaseAgent:
         result = agent.run("Test input")
         
         assert result == "This is a test response from the AI model."
+    
+    @patch('linkedin_agents.Groq')
+    def test_agent_run_reuses_client(self, mock_groq_class, monkeypatch):
+        """Should construct the Groq client once and reuse it across agents."""
+        monkeypatch.setenv("GROQ_API_KEY", "test_key")
+        mock_client = mock_groq_class.return_value
+        mock_client.chat.completions.create.return_value.choices[0].message.content = "ok"
+        
+        Agent("A", "Tester", "Prompt").run("one")
+        Agent("B", "Tester", "Prompt").run("two")
+        
+        mock_groq_class.assert_called_once_with(api_key="test_key")
+        assert mock_client.chat.completions.create.call_count == 2
+
+
+class TestRateLimiter:
+    """Test the shared LLM rate limiter."""
+    
+    @patch('linkedin_agents.time.sleep')
+    def test_allows_burst_within_budget(self, mock_sleep):
+        """Calls under the per-minute budget should not wait."""
+        limiter = RateLimiter(per_minute=5)
+        for _ in range(5):
+            limiter.acquire()
+        
+        mock_sleep.assert_not_called()
+    
+    @patch('linkedin_agents.time.sleep')
+    def test_waits_when_budget_exhausted(self, mock_sleep):
+        """The call after the burst should wait for a token to refill."""
+        limiter = RateLimiter(per_minute=60)
+        limiter._tokens = 0.0
+        mock_sleep.side_effect = lambda s: setattr(limiter, "_tokens", 1.0)
+        
+        limiter.acquire()
+        
+        assert 0 < mock_sleep.call_args[0][0] <= 1.0
+    
+    @patch('linkedin_agents.time.sleep')
+    def test_backoff_blocks_all_callers(self, mock_sleep):
+        """A 429 backoff should delay the next acquire for everyone."""
+        limiter = RateLimiter(per_minute=30)
+        limiter.backoff(10)
+        mock_sleep.side_effect = lambda s: setattr(limiter, "_blocked_until", 0.0)
+        
+        limiter.acquire()
+        
+        assert mock_sleep.call_args[0][0] > 9
+
+
+class TestResearchManager:
+    """Test research aggregation."""
+    
+    def test_run_drops_failed_sources(self, monkeypatch):
+        """Errored or empty sources should not be sent to the LLM."""
+        monkeypatch.delenv("GROQ_API_KEY", raising=False)
+        rm = ResearchManager()
+        rm.hn_connector.get_top_ai_stories = MagicMock(return_value="- Title: Agents everywhere")
+        rm.news_connector.get_tech_headlines = MagicMock(return_value="")
+        rm.arxiv_connector.get_latest_papers = MagicMock(return_value="Error fetching arXiv data.")
+        rm.tavily_connector.search = MagicMock(return_value={"text": "Tavily findings", "images": []})
+        
+        with patch.object(Agent, "run", return_value="report") as mock_run:
+            rm.run("AI agents")
+        
+        prompt = mock_run.call_args[0][0]
+        assert prompt.startswith("AI agents\n\n")
+        assert "REAL-TIME HACKERNEWS DATA:\n- Title: Agents everywhere" in prompt
+        assert "DEEP WEB SEARCH (TAVILY):\nTavily findings" in prompt
+        assert "NEWSAPI" not in prompt
+        assert "ARXIV" not in prompt
 
 
 class TestStrategist:
@@ -79,7 +150,18 @@ class TestGhostwriter:
 
         assert "The Contrarian" in ghostwriter.system_prompt
         assert "80-250 chars" in ghostwriter.system_prompt
-    
+
+    def test_set_vibe_keeps_static_prefix(self):
+        """Different vibes should share the same leading prompt text."""
+        ghostwriter = Ghostwriter()
+        ghostwriter.set_vibe("The Contrarian", "Challenge the status quo.", "Hot take")
+        first = ghostwriter.system_prompt
+        ghostwriter.set_vibe("The Storyteller", "Tell a story.", "Micro story")
+
+        assert first.startswith(Ghostwriter.BASE_PROMPT)
+        assert ghostwriter.system_prompt.startswith(Ghostwriter.BASE_PROMPT)
+        assert "Inspiration: Micro story" in ghostwriter.system_prompt
+
     def test_run_injects_memory_rules(self, temp_memory_file, monkeypatch):
         """Should inject memory rules into prompt."""
         monkeypatch.delenv("GROQ_API_KEY", raising=False)
@@ -111,6 +193,47 @@ class TestArtDirector:
         assert "Medium:" in art_director.system_prompt
         assert art_director.current_medium in art_director.system_prompt
 
+    def test_generate_image_rerolls_seed_after_rate_limit(self):
+        """Retries after a 429 should keep the prompt URL but use a new seed."""
+        limited = MagicMock(status_code=429)
+        ok = MagicMock(status_code=200, headers={"content-type": "image/jpeg"}, content=b"x" * 6000)
+        seeds = []
+
+        def fake_get(url, params, **kwargs):
+            seeds.append(params["seed"])
+            return limited if len(seeds) == 1 else ok
+
+        with patch("linkedin_agents.IMAGE_SESSION.get", side_effect=fake_get) as mock_get, \
+             patch("linkedin_agents.time.sleep"), \
+             patch("linkedin_agents.random.randint", side_effect=[1, 2]):
+            assert ArtDirector().generate_image("concept") == b"x" * 6000
+
+        assert seeds == [1, 2]
+        assert mock_get.call_args_list[0][0] == mock_get.call_args_list[1][0]
+
+    def test_generate_image_rerolls_seed_after_bad_body(self):
+        """A 200 with a non-image body should be retried with a new seed."""
+        html = MagicMock(status_code=200, headers={"content-type": "text/html"})
+        ok = MagicMock(status_code=200, headers={"content-type": "image/jpeg"}, content=b"x" * 6000)
+        seeds = []
+
+        def fake_get(url, params, **kwargs):
+            seeds.append(params["seed"])
+            return html if len(seeds) == 1 else ok
+
+        with patch("linkedin_agents.IMAGE_SESSION.get", side_effect=fake_get), \
+             patch("linkedin_agents.time.sleep"), \
+             patch("linkedin_agents.random.randint", side_effect=[1, 2]):
+            assert ArtDirector().generate_image("concept") == b"x" * 6000
+
+        assert seeds == [1, 2]
+
+    def test_image_session_does_not_retry_transport_errors(self):
+        """Pollinations retries belong to generate_image's loop, not urllib3."""
+        from linkedin_agents import IMAGE_SESSION
+
+        assert IMAGE_SESSION.get_adapter("https://image.pollinations.ai").max_retries.total == 0
+
 
 class TestCritic:
     """Test the Critic agent."""
@@ -134,6 +257,41 @@ class TestCritic:
         rules = critic.memory.get_rules()
         assert any("Avoid generic openings" in r for r in rules)
 
+    @pytest.mark.parametrize("draft,rule", [
+        ("We should leverage agents more", "Never use the word 'leverage'"),
+        ("My build got 35% faster today", "No stats, percentages or multipliers (like '35%' or '10x')"),
+        ("Shipped a 10x cleaner pipeline", "No stats, percentages or multipliers (like '35%' or '10x')"),
+    ])
+    def test_local_ban_skips_llm_but_learns_rule(self, temp_memory_file, draft, rule):
+        """Obvious bans should reject locally without an API call and still record a rule."""
+        critic = Critic(memory=Memory(temp_memory_file))
+
+        with patch.object(Agent, "run") as mock_llm:
+            feedback = critic.run(f"{draft}\n\n(Visual: desk)", draft)
+
+        mock_llm.assert_not_called()
+        assert feedback.startswith("REJECT")
+        assert critic.memory.get_rules() == [rule]
+
+    def test_stats_hits_share_one_rule(self, temp_memory_file):
+        """Different numbers should not each add their own rule."""
+        critic = Critic(memory=Memory(temp_memory_file))
+
+        critic.run("35% faster", "35% faster")
+        critic.run("12% cheaper", "12% cheaper")
+
+        assert len(critic.memory.get_rules()) == 1
+
+    def test_visual_concept_does_not_trigger_local_ban(self, temp_memory_file):
+        """Stats in the visual concept should not count against a clean draft."""
+        critic = Critic(memory=Memory(temp_memory_file))
+        draft = "Let my agent book lunch. It picked tacos."
+
+        with patch.object(Agent, "run", return_value="PASS") as mock_llm:
+            assert critic.run(f"{draft}\n\n(Visual: 30% negative space, 2x upscale)", draft) == "PASS"
+
+        mock_llm.assert_called_once()
+
 
 class TestNetworker:
     """Test the Networker agent."""
@@ -0,0 +1,191 @@
+"""
+Unit tests for the research data connectors.
+Uses mocking to avoid real API calls.
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+import io
+import orjson
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from linkedin_agents import ArxivConnector, HackerNewsConnector, NewsAPIConnector, SESSION, DEFAULT_TIMEOUT
+
+
+def _json_response(payload):
+    """Build a mock HTTP response whose body is payload encoded as JSON."""
+    response = MagicMock()
+    response.content = orjson.dumps(payload)
+    response.raise_for_status = MagicMock()
+    return response
+
+
+def _stream_response(body):
+    """Build a mock streamed HTTP response whose .raw yields body."""
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.raw = io.BytesIO(body.encode())
+    response.raise_for_status = MagicMock()
+    return response
+
+
+class TestSession:
+    """Test the shared HTTP session configuration."""
+
+    def test_retries_transient_errors_but_not_posts(self):
+        """GETs back off on 429/5xx; POSTs are never replayed."""
+        retry = SESSION.get_adapter("https://api.linkedin.com").max_retries
+
+        assert {429, 500, 503}.issubset(retry.status_forcelist)
+        assert retry.respect_retry_after_header
+        assert "GET" in retry.allowed_methods
+        assert "POST" not in retry.allowed_methods
+
+    def test_sets_user_agent_once(self):
+        """Every request should carry the bot's User-Agent."""
+        assert SESSION.headers["User-Agent"].startswith("linkedin-post-twice-daily/")
+
+    @patch('requests.adapters.HTTPAdapter.send')
+    def test_applies_default_timeout(self, mock_send):
+        """Calls without a timeout must not be able to block forever."""
+        adapter = SESSION.get_adapter("https://api.linkedin.com")
+
+        adapter.send(MagicMock(), timeout=None)
+        assert mock_send.call_args.kwargs["timeout"] == DEFAULT_TIMEOUT
+
+        adapter.send(MagicMock(), timeout=90)
+        assert mock_send.call_args.kwargs["timeout"] == 90
+
+    def test_limits_connections_per_host(self):
+        """Extra threads should wait for a pooled connection rather than open more."""
+        adapter = SESSION.get_adapter("https://hacker-news.firebaseio.com")
+
+        assert adapter._pool_block is True
+        assert adapter._pool_maxsize == 8
+
+
+class TestHackerNewsConnector:
+    """Test HackerNews story scanning."""
+
+    @patch('linkedin_agents.SESSION.get')
+    def test_returns_matching_stories_in_rank_order(self, mock_get):
+        """Should keep top-story ranking even though items are fetched in parallel."""
+        items = {
+            1: {"title": "New LLM benchmark", "url": "https://a", "score": 10},
+            2: {"title": "Gardening tips", "url": "https://b", "score": 20},
+            3: {"title": "OpenAI ships agent SDK", "url": "https://c", "score": 30},
+        }
+
+        def fake_get(url, **kwargs):
+            if url.endswith("topstories.json"):
+                return _json_response([1, 2, 3])
+            sid = int(url.rsplit("/", 1)[-1].split(".")[0])
+            return _json_response(items[sid])
+
+        mock_get.side_effect = fake_get
+
+        result = HackerNewsConnector().get_top_ai_stories(limit=5)
+
+        assert "Gardening" not in result
+        assert result.index("New LLM benchmark") < result.index("OpenAI ships agent SDK")
+
+    @patch('linkedin_agents.SESSION.get')
+    def test_stops_at_limit(self, mock_get):
+        """Should return at most `limit` stories."""
+        def fake_get(url, **kwargs):
+            if url.endswith("topstories.json"):
+                return _json_response(list(range(1, 11)))
+            sid = url.rsplit("/", 1)[-1].split(".")[0]
+            return _json_response({"title": f"AI story {sid}", "url": "", "score": 1})
+
+        mock_get.side_effect = fake_get
+
+        result = HackerNewsConnector().get_top_ai_stories(limit=2)
+
+        assert result.count("- Title:") == 2
+        assert "AI story 1\n" in result
+        assert "AI story 2\n" in result
+
+    @patch('linkedin_agents.SESSION.get')
+    def test_skips_unavailable_items(self, mock_get):
+        """Deleted (null) items should be skipped rather than failing the scan."""
+        def fake_get(url, **kwargs):
+            if url.endswith("topstories.json"):
+                return _json_response([1, 2])
+            if url.endswith("/1.json"):
+                return _json_response(None)
+            return _json_response({"title": "GPT tooling", "url": "", "score": 1})
+
+        mock_get.side_effect = fake_get
+
+        result = HackerNewsConnector().get_top_ai_stories(limit=5)
+
+        assert "GPT tooling" in result
+
+    @pytest.mark.parametrize("title,expected", [
+        ("ChatGPT gets memory", True),
+        ("Building AI-native apps", True),
+        ("Open models beat closed LLMs", True),
+        ("Agentic workflows in practice", True),
+        ("Chatbots are dead", True),
+        ("GenAI startups raise", True),
+        ("Are AIs conscious?", True),
+        ("xAI releases Grok", True),
+        ("Show HN: my Slackbot", True),
+        ("Rust 2.0 released", False),
+    ])
+    def test_title_filter(self, title, expected):
+        """Keyword filter should match keywords anywhere in the title, like a substring check."""
+        assert bool(HackerNewsConnector.AI_TITLE_PATTERN.search(title)) is expected
+
+
+class TestNewsAPIConnector:
+    """Test NewsAPI headline fetching."""
+
+    @patch('linkedin_agents.SESSION.get')
+    def test_requests_only_needed_articles(self, mock_get, monkeypatch):
+        """Page size should match the limit instead of over-fetching."""
+        monkeypatch.setenv("NEWS_API_KEY", "test_news_key")
+        mock_get.return_value = _json_response({"articles": [
+            {"title": "Chip news", "url": "https://a", "source": {"name": "Wire"}},
+        ]})
+
+        result = NewsAPIConnector().get_tech_headlines(limit=3)
+
+        assert "pageSize=3" in mock_get.call_args[0][0]
+        assert "Chip news" in result
+        assert "Source: Wire" in result
+
+
+class TestArxivConnector:
+    """Test arXiv feed parsing."""
+
+    @patch('linkedin_agents.SESSION.get')
+    def test_parses_entries(self, mock_get, sample_arxiv_response):
+        """Should extract title, link and abstract from the streamed feed."""
+        mock_get.return_value = _stream_response(sample_arxiv_response)
+
+        result = ArxivConnector().get_latest_papers(limit=3)
+
+        assert "Large Language Models for Code Generation" in result
+        assert "http://arxiv.org/abs/2301.00001" in result
+        assert mock_get.call_args.kwargs["stream"] is True
+
+    @patch('linkedin_agents.SESSION.get')
+    def test_stops_at_limit(self, mock_get):
+        """Should stop parsing once `limit` entries have been read."""
+        entries = "".join(
+            f"<entry><title>Paper {i}</title><id>http://arxiv.org/abs/{i}</id><summary>S</summary></entry>"
+            for i in range(5)
+        )
+        feed = f'<feed xmlns="http://www.w3.org/2005/Atom">{entries}</feed>'
+        mock_get.return_value = _stream_response(feed)
+
+        result = ArxivConnector().get_latest_papers(limit=2)
+
+        assert result.count("- Title:") == 2
+        assert "Paper 2" not in result
+        assert "max_results=2&" in mock_get.call_args[0][0]
@@ -0,0 +1,53 @@
+"""
+Unit tests for the dashboard's chart downsampling.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Importing the dashboard runs the page script in Streamlit's bare mode
+from dashboard import lttb_indices
+
+
+class TestLttbIndices:
+    """Test Largest-Triangle-Three-Buckets index selection."""
+
+    @pytest.mark.parametrize("n_out", [3, 10, 99])
+    def test_returns_sorted_indices_of_requested_length(self, n_out):
+        """Output should be exactly n_out strictly increasing indices."""
+        x = np.arange(100)
+        y = np.sin(x / 5)
+
+        indices = lttb_indices(x, y, n_out)
+
+        assert len(indices) == n_out
+        assert np.all(np.diff(indices) > 0)
+
+    def test_keeps_first_and_last_points(self):
+        x = np.arange(50)
+        y = np.random.default_rng(0).random(50)
+
+        indices = lttb_indices(x, y, 10)
+
+        assert indices[0] == 0
+        assert indices[-1] == 49
+
+    @pytest.mark.parametrize("n_out", [20, 25, 2, 0])
+    def test_returns_everything_when_not_downsampling(self, n_out):
+        """n_out >= n, or too small to form a triangle, keeps every point."""
+        x = np.arange(20)
+
+        assert list(lttb_indices(x, x, n_out)) == list(range(20))
+
+    def test_keeps_spike_inside_bucket(self):
+        """A single outlier should survive downsampling."""
+        x = np.arange(1000)
+        y = np.zeros(1000)
+        y[437] = 100.0
+
+        assert 437 in lttb_indices(x, y, 20)
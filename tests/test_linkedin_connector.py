@@ -38,7 +38,7 @@ class TestLinkedInConnectorInit:
 class TestLinkedInImageUpload:
     """Test LinkedIn image upload flow."""
     
-    @patch('requests.post')
+    @patch('linkedin_agents.SESSION.post')
     def test_register_upload_success(self, mock_post, mock_linkedin_credentials):
         """Should register upload and return URL + URN."""
         mock_response = MagicMock()
@@ -57,7 +57,7 @@ class TestLinkedInImageUpload:
         assert upload_url == 'https://upload.linkedin.com/test'
         assert image_urn == 'urn:li:image:123'
     
-    @patch('requests.put')
+    @patch('linkedin_agents.SESSION.put')
     def test_upload_image_success(self, mock_put, mock_linkedin_credentials):
         """Should upload image binary successfully."""
         mock_response = MagicMock()
@@ -83,7 +83,7 @@ class TestLinkedInPosting:
         
         assert result is None
     
-    @patch('requests.post')
+    @patch('linkedin_agents.SESSION.post')
     def test_post_text_only_success(self, mock_post, mock_linkedin_credentials):
         """Should post text-only content successfully."""
         mock_response = MagicMock()
@@ -98,7 +98,7 @@ class TestLinkedInPosting:
         assert result == 'urn:li:share:999'
         mock_post.assert_called_once()
     
-    @patch('requests.post')
+    @patch('linkedin_agents.SESSION.post')
     def test_post_failure_handling(self, mock_post, mock_linkedin_credentials):
         """Should handle API errors gracefully."""
         mock_post.side_effect = requests.exceptions.HTTPError("API Error")
@@ -112,7 +112,7 @@ class TestLinkedInPosting:
 class TestLinkedInSocialActions:
     """Test LinkedIn social actions (stats) retrieval."""
     
-    @patch('requests.get')
+    @patch('linkedin_agents.SESSION.get')
     def test_get_social_actions_success(self, mock_get, mock_linkedin_credentials):
         """Should retrieve likes and comments."""
         mock_response = MagicMock()
@@ -130,7 +130,7 @@ class TestLinkedInSocialActions:
         assert stats['likes'] == 42
         assert stats['comments'] == 7
     
-    @patch('requests.get')
+    @patch('linkedin_agents.SESSION.get')
     def test_get_social_actions_404(self, mock_get, mock_linkedin_credentials):
         """Should return zeros for 404 (post not found)."""
         mock_response = MagicMock()
@@ -142,7 +142,7 @@ class TestLinkedInSocialActions:
         
         assert stats == {"likes": 0, "comments": 0}
     
-    @patch('requests.get')
+    @patch('linkedin_agents.SESSION.get')
     def test_get_social_actions_403_permission(self, mock_get, mock_linkedin_credentials):
         """Should handle 403 permission denied."""
         mock_response = MagicMock()
@@ -0,0 +1,62 @@
+"""
+Unit tests for logging configuration.
+"""
+
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logging_config import SensitiveDataFilter, set_log_level
+
+
+def _record(msg, *args):
+    return logging.LogRecord("test", logging.INFO, __file__, 1, msg, args, None)
+
+
+class TestSensitiveDataFilter:
+    """Test masking of secrets in log output."""
+
+    def test_redacts_message_text(self):
+        """Secrets embedded in the message itself should be masked."""
+        record = _record("Authorization: Bearer abc123")
+        SensitiveDataFilter().filter(record)
+
+        assert record.getMessage() == "Authorization: Bearer [REDACTED]"
+
+    def test_redacts_lazy_args(self):
+        """Secrets passed as %-style args should be masked too."""
+        record = _record("Posting as %s", "urn:li:person:XyZ123")
+        SensitiveDataFilter().filter(record)
+
+        assert record.getMessage() == "Posting as urn:li:person:[REDACTED]"
+
+    def test_redacts_raw_message_when_args_mismatch(self):
+        """A bad format/args pair should not leak the secret or raise."""
+        record = _record("Token %d for Bearer abc123", "not-a-number")
+
+        assert SensitiveDataFilter().filter(record) is True
+        assert record.getMessage() == "Token %d for Bearer [REDACTED]"
+
+
+class TestSetLogLevel:
+    """Test log level precedence between LOG_LEVEL and config.yaml."""
+
+    def test_uses_config_level(self, monkeypatch):
+        monkeypatch.delenv("LOG_LEVEL", raising=False)
+        set_log_level("warning", name="test_levels")
+
+        assert logging.getLogger("test_levels").level == logging.WARNING
+
+    def test_env_var_overrides_config(self, monkeypatch):
+        monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+        set_log_level("WARNING", name="test_levels")
+
+        assert logging.getLogger("test_levels").level == logging.DEBUG
+
+    def test_defaults_to_info(self, monkeypatch):
+        monkeypatch.delenv("LOG_LEVEL", raising=False)
+        set_log_level(None, name="test_levels")
+
+        assert logging.getLogger("test_levels").level == logging.INFO
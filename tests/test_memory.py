@@ -8,6 +8,7 @@ import os
 import tempfile
 import threading
 from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
 # Import will work after we update linkedin_agents.py
 import sys
@@ -52,6 +53,119 @@ class TestMemoryBasics:
         assert rules == []  # Should return empty, not crash
 
 
+class TestMemorySave:
+    """Test atomic writes of the memory file."""
+    
+    def test_failed_write_keeps_previous_file(self, temp_memory_file):
+        """A serialization error must not truncate the existing file."""
+        memory = Memory(temp_memory_file)
+        memory.add_rule("Keep it short")
+        directory = os.path.dirname(temp_memory_file)
+        before = set(os.listdir(directory))
+        
+        with pytest.raises(TypeError):
+            memory._save({"rules": [object()], "history": []})
+        
+        with open(temp_memory_file, 'r') as f:
+            assert json.load(f)["rules"] == ["Keep it short"]
+        assert set(os.listdir(directory)) - before == set()
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+    def test_write_keeps_file_mode(self, temp_memory_file):
+        """Replacing the file must not narrow its permissions to owner-only."""
+        os.chmod(temp_memory_file, 0o644)
+        memory = Memory(temp_memory_file)
+        memory.add_rule("Keep it short")
+
+        assert os.stat(temp_memory_file).st_mode & 0o777 == 0o644
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+    def test_new_file_defaults_to_0644(self, tmp_path):
+        """A freshly created memory file should be world-readable, not owner-only."""
+        memory_path = tmp_path / "new_memory.json"
+        Memory(str(memory_path))
+
+        assert os.stat(memory_path).st_mode & 0o777 == 0o644
+
+    def test_round_trips_unicode(self, temp_memory_file):
+        """Emoji in rules and comment packs should survive a write/read cycle."""
+        memory = Memory(temp_memory_file)
+        memory.add_rule("Use 🚀 sparingly")
+        
+        assert Memory(temp_memory_file).get_rules() == ["Use 🚀 sparingly"]
+        with open(temp_memory_file, 'r', encoding='utf-8') as f:
+            assert json.load(f)["rules"] == ["Use 🚀 sparingly"]
+
+    def test_read_only_never_writes(self, tmp_path):
+        """Dry-run memory keeps changes in-process and leaves the file alone."""
+        memory_path = tmp_path / "memory.json"
+        memory_path.write_text(json.dumps({"rules": [], "history": [{"date": "1", "topic": "Old", "vibe": "V", "urn": "u1", "stats": {}}]}))
+        before = memory_path.read_text()
+        memory = Memory(str(memory_path), read_only=True)
+
+        memory.add_rule("Keep it short")
+        memory.save_comment_pack("Pack")
+
+        assert memory.get_rules() == ["Keep it short"]
+        assert memory.archive_old_posts(days=90) == 0
+        assert memory_path.read_text() == before
+        assert not (tmp_path / "memory_archive.json").exists()
+
+    def test_read_only_does_not_create_file(self, tmp_path):
+        memory_path = tmp_path / "memory.json"
+        memory = Memory(str(memory_path), read_only=True)
+
+        assert memory.get_rules() == []
+        assert not memory_path.exists()
+
+
+class TestMemoryCache:
+    """Test in-process caching of the parsed memory file."""
+    
+    def test_load_reuses_parsed_data(self, temp_memory_file):
+        """Unchanged file should not be re-parsed."""
+        memory = Memory(temp_memory_file)
+        
+        assert memory._load() is memory._load()
+    
+    def test_load_picks_up_external_changes(self, temp_memory_file, sample_memory_data):
+        """Edits made outside this instance should be visible on next read."""
+        memory = Memory(temp_memory_file)
+        assert memory.get_rules() == []
+        
+        with open(temp_memory_file, 'w') as f:
+            json.dump(sample_memory_data, f)
+        
+        assert "Avoid corporate buzzwords" in memory.get_rules()
+    
+    def test_reads_do_not_take_file_lock(self, temp_memory_file):
+        """Plain reads should not pay for a lock acquire."""
+        memory = Memory(temp_memory_file)
+        
+        with patch.object(memory.lock, "acquire", side_effect=AssertionError("locked on read")):
+            assert memory.get_rules() == []
+            assert "No past performance data" in memory.get_performance_insights()
+    
+    def test_shared_instance_sees_own_writes(self, temp_memory_file):
+        """Writes through one instance are visible without re-reading the file."""
+        memory = Memory(temp_memory_file)
+        memory.add_rule("Keep it short")
+        
+        assert memory._load()["rules"] == ["Keep it short"]
+
+    def test_failed_write_leaves_cache_untouched(self, temp_memory_file):
+        """Lock-free readers must never see a change that didn't reach disk."""
+        memory = Memory(temp_memory_file)
+        cached = memory._load()
+
+        with patch("linkedin_agents.write_json_atomic", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                memory.add_rule("Keep it short")
+
+        assert cached["rules"] == []
+        assert memory.get_rules() == []
+
+
 class TestMemoryRules:
     """Test Memory rule operations."""
     
@@ -116,6 +230,20 @@ class TestMemoryPerformance:
         insights = memory.get_performance_insights()
         
         assert "The Analyst" in insights
+    
+    def test_insights_follow_stats_updates(self, temp_memory_file):
+        """Best post should track likes as stats come in, including drops."""
+        memory = Memory(temp_memory_file)
+        memory.add_post_history("Topic A", "The Analyst", "urn:a")
+        memory.add_post_history("Topic B", "The Storyteller", "urn:b")
+        memory.get_performance_insights()
+        
+        memory.update_post_stats("urn:a", 10, 0)
+        memory.update_post_stats("urn:b", 5, 0)
+        assert "The Analyst" in memory.get_performance_insights()
+        
+        memory.update_post_stats("urn:a", 2, 0)
+        assert "The Storyteller" in memory.get_performance_insights()
 
 
 class TestMemoryConcurrency:
@@ -138,6 +266,28 @@ class TestMemoryConcurrency:
         # Verify file is valid JSON and has all rules
         data = memory._load()
         assert len(data["rules"]) == 15  # 3 threads * 5 rules each
+    
+    def test_concurrent_mixed_writes_keep_all_updates(self, temp_memory_file):
+        """Comment-pack saves must not drop history written by other threads."""
+        memory = Memory(temp_memory_file)
+        
+        def add_posts(thread_id):
+            for i in range(5):
+                memory.add_post_history(f"Topic {thread_id}-{i}", "The Analyst", f"urn:{thread_id}:{i}")
+        
+        def save_packs():
+            for i in range(5):
+                memory.save_comment_pack(f"Pack {i}")
+        
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(add_posts, i) for i in range(2)]
+            futures.append(executor.submit(save_packs))
+            for f in futures:
+                f.result()
+        
+        data = memory._load()
+        assert len(data["history"]) == 10
+        assert data["latest_comment_pack"] == "Pack 4"
 
 
 class TestMemoryArchive:
@@ -169,3 +319,45 @@ class TestMemoryArchive:
         data = memory._load()
         assert len(data["history"]) == 1
         assert data["history"][0]["topic"] == "New"
+    
+    def test_archive_old_posts_with_iso_dates(self, temp_memory_file):
+        """Posts stored with ISO dates (the current format) should be archived too."""
+        from datetime import datetime, timedelta
+        
+        old_date = (datetime.now() - timedelta(days=120)).isoformat()
+        new_date = datetime.now().isoformat()
+        data = {
+            "rules": [],
+            "history": [
+                {"date": "manual", "topic": "Manual", "vibe": "V", "urn": "u0", "stats": {}},
+                {"date": old_date, "topic": "Old", "vibe": "V", "urn": "u1", "stats": {}},
+                {"date": new_date, "topic": "New", "vibe": "V", "urn": "u2", "stats": {}},
+            ]
+        }
+        with open(temp_memory_file, 'w') as f:
+            json.dump(data, f)
+        archive_path = temp_memory_file.replace(".json", "_archive.json")
+        
+        try:
+            memory = Memory(temp_memory_file)
+            assert memory.archive_old_posts(days=90) == 1
+            assert [p["topic"] for p in memory._load()["history"]] == ["Manual", "New"]
+            with open(archive_path, 'r') as f:
+                assert [p["topic"] for p in json.load(f)] == ["Old"]
+        finally:
+            if os.path.exists(archive_path):
+                os.remove(archive_path)
+    
+    def test_archive_keeps_out_of_range_timestamps(self, temp_memory_file):
+        """An oversized legacy timestamp should be kept, not abort the run."""
+        data = {
+            "rules": [],
+            "history": [{"date": "9" * 30, "topic": "Odd", "vibe": "V", "urn": "u1", "stats": {}}]
+        }
+        with open(temp_memory_file, 'w') as f:
+            json.dump(data, f)
+        
+        memory = Memory(temp_memory_file)
+        
+        assert memory.archive_old_posts(days=90) == 0
+        assert memory._load()["history"][0]["topic"] == "Odd"
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 from linkedin_agents import ArtDirector, STYLE_MATRIX, VIBES, POST_FORMATS, OrganicImageSearcher, Orchestrator
 import json
 import os
+import threading
 
 def test_art_director_randomizes_style():
     ad = ArtDirector()
@@ -24,9 +25,11 @@ def test_organic_image_searcher_logic():
             "images": ["https://example.com/img1.jpg", "https://example.com/img2.jpg"]
         }
         
-        with patch("requests.get") as mock_get:
-            mock_get.return_value.content = b"fake_image_data"
-            mock_get.return_value.status_code = 200
+        with patch("linkedin_agents.SESSION.get") as mock_get:
+            mock_resp = mock_get.return_value.__enter__.return_value
+            mock_resp.content = b"fake_image_data"
+            mock_resp.status_code = 200
+            mock_resp.headers = {"content-type": "image/jpeg"}
             
             searcher = OrganicImageSearcher()
             img_data = searcher.get_organic_image("AI agents")
@@ -35,7 +38,18 @@ def test_organic_image_searcher_logic():
             mock_search.assert_called_once()
             assert "include_images=True" in str(mock_search.call_args) or mock_search.call_args[1].get("include_images") == True
 
-def test_orchestrator_selects_format_and_vibe():
+def test_organic_image_searcher_skips_non_image_response():
+    with patch("linkedin_agents.TavilyConnector.search") as mock_search:
+        mock_search.return_value = {"text": "", "images": ["https://example.com/page"]}
+        
+        with patch("linkedin_agents.SESSION.get") as mock_get:
+            mock_resp = mock_get.return_value.__enter__.return_value
+            mock_resp.headers = {"content-type": "text/html; charset=utf-8"}
+            
+            assert OrganicImageSearcher().get_organic_image("AI agents") is None
+            assert mock_get.call_args[1].get("stream") is True
+
+def test_orchestrator_selects_format_and_vibe(mock_linkedin_credentials):
     with patch("linkedin_agents.ResearchManager.run") as mock_research:
         mock_research.return_value = "Trend brief"
         with patch("linkedin_agents.Strategist.run") as mock_strat:
@@ -62,6 +76,122 @@ def test_orchestrator_selects_format_and_vibe():
                         assert "Inspiration:" in orch.ghostwriter.system_prompt
                         assert "80-250 chars" in orch.ghostwriter.system_prompt
 
+def test_content_phase_runs_writer_and_art_director_concurrently():
+    # Each mock waits for the other; a sequential phase would break the barrier
+    barrier = threading.Barrier(2, timeout=5)
+    
+    def wait_then(result):
+        def run(_strategy):
+            barrier.wait()
+            return result
+        return run
+    
+    with patch("linkedin_agents.Ghostwriter.run", side_effect=wait_then("Post text")), \
+         patch("linkedin_agents.ArtDirector.run", side_effect=wait_then("Visual concept")):
+        orch = Orchestrator()
+        
+        assert orch._content_phase("Strategy") == ("Post text", "Visual concept")
+
+def test_publish_phase_posts_while_critic_reviews():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def critic_run(_package, _draft):
+        barrier.wait()
+        return "PASS"
+
+    def post_content(_text, _image):
+        barrier.wait()
+        return None
+
+    with patch("linkedin_agents.Critic.run", side_effect=critic_run), \
+         patch("linkedin_agents.LinkedInConnector.post_content", side_effect=post_content):
+        orch = Orchestrator()
+
+        assert orch._publish_phase("Post text", "Visual", None, "AI", "The Analyst") is None
+
+def test_organic_image_prefetched_during_strategy(monkeypatch, mock_linkedin_credentials):
+    # The strategist waits for the image search to start; a serial workflow would time out
+    monkeypatch.setenv("FORCED_VIBE", "The Storyteller")
+    barrier = threading.Barrier(2, timeout=5)
+
+    def search(_topic):
+        barrier.wait()
+        return b"photo"
+
+    def strategize(_brief):
+        barrier.wait()
+        return "Strategy"
+
+    with patch("linkedin_agents.Orchestrator.review_past_performance"), \
+         patch("linkedin_agents.Orchestrator._research_phase", return_value=("AI", "Trend brief")), \
+         patch("linkedin_agents.Orchestrator._networking_phase"), \
+         patch("linkedin_agents.Strategist.run", side_effect=strategize), \
+         patch("linkedin_agents.OrganicImageSearcher.get_organic_image", side_effect=search), \
+         patch("linkedin_agents.Orchestrator._content_phase", return_value=("Post text", "Visual")), \
+         patch("linkedin_agents.Orchestrator._publish_phase", return_value="urn:li:share:1") as mock_publish:
+        orch = Orchestrator()
+        orch.config = {
+            "variety": {"image_mode_preference": "always_real"},
+            "features": {"enable_organic_visuals": True, "enable_image_generation": False},
+        }
+
+        assert orch.run_workflow() == "urn:li:share:1"
+        assert mock_publish.call_args[0][2] == b"photo"
+
+def test_workflow_stops_early_without_credentials(monkeypatch):
+    monkeypatch.delenv("LINKEDIN_ACCESS_TOKEN", raising=False)
+    monkeypatch.delenv("LINKEDIN_PERSON_URN", raising=False)
+    monkeypatch.delenv("DRY_RUN", raising=False)
+
+    with patch("linkedin_agents.Orchestrator._research_phase") as mock_research:
+        assert Orchestrator().run_workflow() is None
+
+    mock_research.assert_not_called()
+
+def test_workflow_dry_run_skips_credential_check(monkeypatch):
+    monkeypatch.delenv("LINKEDIN_ACCESS_TOKEN", raising=False)
+    monkeypatch.delenv("LINKEDIN_PERSON_URN", raising=False)
+    monkeypatch.setenv("DRY_RUN", "1")
+
+    with patch("linkedin_agents.Orchestrator.review_past_performance"), \
+         patch("linkedin_agents.Orchestrator._research_phase", return_value=("AI", None)) as mock_research:
+        assert Orchestrator().run_workflow() is None
+
+    mock_research.assert_called_once()
+
+@pytest.mark.parametrize("value", ["0", "false", "no", ""])
+def test_falsy_dry_run_values_keep_credential_check(monkeypatch, value):
+    monkeypatch.delenv("LINKEDIN_ACCESS_TOKEN", raising=False)
+    monkeypatch.delenv("LINKEDIN_PERSON_URN", raising=False)
+    monkeypatch.setenv("DRY_RUN", value)
+
+    with patch("linkedin_agents.Orchestrator._research_phase") as mock_research:
+        assert Orchestrator().run_workflow() is None
+
+    mock_research.assert_not_called()
+
+def test_dry_run_never_posts(monkeypatch, mock_linkedin_credentials):
+    monkeypatch.setenv("DRY_RUN", "1")
+
+    with patch("linkedin_agents.Critic.run", return_value="PASS"), \
+         patch("linkedin_agents.LinkedInConnector.post_content") as mock_post:
+        orch = Orchestrator()
+
+        assert orch._publish_phase("Post text", "Visual", None, "AI", "The Analyst") is None
+
+    mock_post.assert_not_called()
+    assert orch.dry_run_draft.startswith("Post text")
+
+def test_dry_run_draft_unset_when_workflow_stops_early(monkeypatch):
+    monkeypatch.setenv("DRY_RUN", "1")
+
+    with patch("linkedin_agents.Orchestrator.review_past_performance"), \
+         patch("linkedin_agents.Orchestrator._research_phase", return_value=("AI", None)):
+        orch = Orchestrator()
+        orch.run_workflow()
+
+    assert orch.dry_run_draft is None
+
 def test_vibes_structure():
     for vibe, config in VIBES.items():
         assert "strategist" in config